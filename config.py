@@ -21,15 +21,29 @@ DATABASES = {
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
         'ATOMIC_REQUESTS': True,
-        'CONN_MAX_AGE': 60,
+        # Постоянное соединение: не переподключаемся на каждый запрос,
+        # перед повторным использованием соединение проверяется.
+        # Вне HTTP-запросов оба параметра работают только через
+        # close_old_connections() — его вызывает ui.main_window.db_action
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'connect_timeout': 10,
         }
     }
 }
 
+# Подключение через PgBouncer (pool_mode=transaction): пулом управляет PgBouncer,
+# а серверные курсоры между транзакциями не переживают
+if os.getenv('DB_PGBOUNCER', 'False') == 'True':
+    DATABASES['default'].update({
+        'CONN_MAX_AGE': 0,
+        'DISABLE_SERVER_SIDE_CURSORS': True,
+    })
+
 # Настройки Django
 INSTALLED_APPS = [
+    'django.contrib.postgres',
     'database',
 ]
 
@@ -1,305 +1,493 @@
 """
 Обработчик базы данных PostgreSQL с Django ORM
 """
+import itertools
+import logging
 import os
-import sys
-import django
+import threading
+import weakref
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from django.core.exceptions import ObjectDoesNotExist
+from typing import List, Optional, Dict, Any, Iterator, Union
+from django.contrib.postgres.search import TrigramSimilarity
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import transaction, connection
+from django.db.models import Q
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+from django.utils import timezone
 from django.db.utils import OperationalError, IntegrityError, ProgrammingError
 
-# Добавляем текущую директорию в путь Python
-current_dir = Path(__file__).parent.parent
-sys.path.append(str(current_dir))
+if is_psycopg3:
+    from psycopg.rows import dict_row
+else:
+    from psycopg2.extras import RealDictCursor
 
-# Настраиваем Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config')
+logger = logging.getLogger(__name__)
 
+# Django настраивает вызывающий код (main.py, manage.py) до импорта модуля.
+# Без настроенного Django модуль не импортируется, поэтому методы обработчика
+# не проверяют это при каждом вызове
 try:
-    django.setup()
-    from .models import Customer, Product, Order, OrderItem, Student, Teacher
-    from django.db import models as django_models
-    DJANGO_SETUP = True
+    from .models import Customer, Product, Order, OrderItem, Student
 except Exception as e:
-    print(f"❌ Ошибка настройки Django: {e}")
-    DJANGO_SETUP = False
-    Customer = Product = Order = OrderItem = Student = Teacher =None
-    django_models = None
+    raise ImportError(f"Django не настроен: {e}") from e
+
+
+# Сколько строк серверный курсор забирает за одно обращение при потоковом чтении
+STREAM_ITERSIZE = 2000
+
+_cursor_counter = itertools.count(1)
+
+
+def _dict_cursor(name: str = None):
+    """
+    Курсор драйвера PostgreSQL, возвращающий строки в виде словарей.
+
+    С name создается именованный (серверный) курсор; вне транзакции он
+    объявляется WITH HOLD, как это делает Django для chunked_cursor().
+    """
+    raw_connection = connection.connection
+    if name is None:
+        if is_psycopg3:
+            return raw_connection.cursor(row_factory=dict_row)
+        return raw_connection.cursor(cursor_factory=RealDictCursor)
+
+    withhold = connection.get_autocommit()
+    if is_psycopg3:
+        return raw_connection.cursor(name, row_factory=dict_row, withhold=withhold)
+    return raw_connection.cursor(name, cursor_factory=RealDictCursor, withhold=withhold)
+
+
+# Соединения (драйвера), на которых уже выполнен PREPARE частых запросов
+_PREPARED_CONNECTIONS = weakref.WeakSet()
+
+
+def _use_prepared_statements() -> bool:
+    """
+    Ручные PREPARE нужны только для psycopg2 (psycopg 3 готовит запросы сам)
+    и недоступны через PgBouncer в режиме transaction.
+    """
+    return not is_psycopg3 and not connection.settings_dict.get('DISABLE_SERVER_SIDE_CURSORS')
+
+
+def _prepared_statements_sql() -> str:
+    """PREPARE для частых точечных выборок (колонки перечислены явно)"""
+    statements = {
+        'get_customer': (Customer, 'id = $1'),
+        'products_by_category': (Product, 'category = $1 AND is_active'),
+        'low_stock_products': (Product, 'quantity < $1 AND is_active'),
+    }
+    sql = []
+    for name, (model, where) in statements.items():
+        columns = ', '.join(connection.ops.quote_name(f.column) for f in model._meta.concrete_fields)
+        sql.append(f"PREPARE {name} AS SELECT {columns} FROM {model._meta.db_table} WHERE {where}")
+    return '; '.join(sql)
+
+
+def _execute_prepared(model, name: str, *params) -> list:
+    """
+    Выполнение подготовленного запроса: разбор и планирование делаются
+    сервером один раз на соединение, дальше передаются только параметры.
+    """
+    connection.ensure_connection()
+    if connection.connection not in _PREPARED_CONNECTIONS:
+        with connection.cursor() as cursor:
+            cursor.execute(_prepared_statements_sql())
+        _PREPARED_CONNECTIONS.add(connection.connection)
+
+    placeholders = ', '.join(['%s'] * len(params))
+    return list(model.objects.raw(f"EXECUTE {name} ({placeholders})", params))
+
+
+# Максимум позиций заказа в одном INSERT
+ORDER_ITEMS_BATCH_SIZE = 10_000
+
+# Поля клиента, достаточные для списков и поиска
+CUSTOMER_LIST_FIELDS = ('id', 'first_name', 'last_name', 'email', 'phone')
+
+# Минимальная триграммная похожесть имени или фамилии при поиске клиентов
+NAME_SIMILARITY_THRESHOLD = 0.2
 
 
 class PostgreSQLHandler:
-    """Класс для работы с PostgreSQL через Django ORM"""
+    """
+    Класс для работы с PostgreSQL через Django ORM.
 
-    def __init__(self):
-        if not DJANGO_SETUP:
-            print("❌ Django не настроен. Проверьте настройки.")
-            return
-        self.check_connection()
+    Подключение при создании не проверяется — для этого есть check_connection().
+    Общий экземпляр возвращает get_instance().
+
+    Ошибки БД методы логируют и возвращают None / [] / False. Исключение —
+    create_customer(), create_product() и create_order(): некорректные поля
+    (длина, формат email, значение вне choices) они не глотают, а пробрасывают
+    как ValidationError, чтобы вызывающий код мог показать текст ошибки.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> 'PostgreSQLHandler':
+        """Общий экземпляр обработчика (создается при первом обращении)"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
 
     def check_connection(self) -> bool:
         """Проверка соединения с базой данных"""
-        if not DJANGO_SETUP:
-            return False
-
         try:
             with connection.cursor() as cursor:
                 cursor.execute("SELECT version();")
                 result = cursor.fetchone()
-                print(f"✅ Подключено к PostgreSQL: {result[0]}")
+                logger.info("✅ Подключено к PostgreSQL: %s", result[0])
                 return True
         except OperationalError as e:
-            print(f"❌ Ошибка подключения к PostgreSQL: {e}")
-            print("\nПроверьте:")
-            print("1. Запущен ли PostgreSQL сервер")
-            print("2. Правильность данных в файле .env")
-            print(f"3. Существует ли база данных '{os.getenv('DB_NAME', 'desktop_app_db')}'")
-            print("4. Правильность логина и пароля")
+            logger.error(
+                "❌ Ошибка подключения к PostgreSQL: %s\n"
+                "Проверьте:\n"
+                "1. Запущен ли PostgreSQL сервер\n"
+                "2. Правильность данных в файле .env\n"
+                "3. Существует ли база данных '%s'\n"
+                "4. Правильность логина и пароля",
+                e, os.getenv('DB_NAME', 'desktop_app_db')
+            )
             return False
         except Exception as e:
-            print(f"❌ Неожиданная ошибка при подключении: {e}")
+            logger.error("❌ Неожиданная ошибка при подключении: %s", e, exc_info=True)
             return False
 
-    @transaction.atomic
     def create_customer(self, **kwargs) -> Optional[Customer]:
-        """Создание нового клиента"""
-        if not DJANGO_SETUP:
-            return None
+        """
+        Создание нового клиента.
 
+        Некорректные поля (длина, формат email) — ValidationError с текстом ошибки.
+        """
         try:
-            customer = Customer.objects.create(**kwargs)
-            print(f"✅ Клиент создан: {customer}")
+            customer = Customer(**kwargs)
+            # Длину проверяем до INSERT: иначе PostgreSQL ответит DataError
+            customer.clean_fields()
+            customer.save(force_insert=True)
+            logger.debug("✅ Клиент создан: %s", customer)
             return customer
+        except ValidationError:
+            raise
         except IntegrityError as e:
-            print(f"❌ Ошибка при создании клиента (дубликат email): {e}")
+            logger.warning("❌ Ошибка при создании клиента (дубликат email): %s", e)
             return None
         except Exception as e:
-            print(f"❌ Неожиданная ошибка при создании клиента: {e}")
-            return None
-
-    def get_customer(self, customer_id: int) -> Optional[Customer]:
-        """Получение клиента по ID"""
-        if not DJANGO_SETUP:
+            logger.error("❌ Неожиданная ошибка при создании клиента: %s", e, exc_info=True)
             return None
 
+    def get_customer(self, customer_id: int, fields: tuple = None) -> Optional[Customer]:
+        """Получение клиента по ID (fields — загрузить только указанные поля)"""
         try:
-            return Customer.objects.get(id=customer_id)
+            if fields or not _use_prepared_statements():
+                queryset = Customer.objects.all()
+                if fields:
+                    queryset = queryset.only(*fields)
+                return queryset.get(id=customer_id)
+
+            customers = _execute_prepared(Customer, 'get_customer', customer_id)
+            if not customers:
+                raise Customer.DoesNotExist
+            return customers[0]
         except ObjectDoesNotExist:
-            print(f"❌ Клиент с ID {customer_id} не найден")
+            logger.warning("❌ Клиент с ID %s не найден", customer_id)
             return None
         except Exception as e:
-            print(f"❌ Неожиданная ошибка при получении клиента: {e}")
+            logger.error("❌ Неожиданная ошибка при получении клиента: %s", e, exc_info=True)
             return None
 
-    def get_customers_by_name(self, name: str) -> List[Customer]:
-        """Поиск клиентов по имени"""
-        if not DJANGO_SETUP:
-            return []
+    def get_customers_by_name(self, name: str,
+                              fields: tuple = CUSTOMER_LIST_FIELDS) -> List[Customer]:
+        """
+        Нечеткий поиск клиентов по имени или фамилии (pg_trgm).
 
+        Результаты упорядочены по убыванию похожести; по умолчанию
+        загружаются только поля CUSTOMER_LIST_FIELDS.
+        """
         try:
-            return list(Customer.objects.filter(
-                django_models.Q(first_name__icontains=name) |
-                django_models.Q(last_name__icontains=name)
-            ))
+            # Оператор % (trigram_similar) обслуживается GIN-индексом customers_name_trgm_idx,
+            # ILIKE '%...%' по btree приводил к полному сканированию таблицы
+            queryset = Customer.objects.filter(
+                Q(first_name__trigram_similar=name) |
+                Q(last_name__trigram_similar=name)
+            ).annotate(
+                similarity=TrigramSimilarity('first_name', name) + TrigramSimilarity('last_name', name)
+            ).order_by('-similarity')
+            if fields:
+                queryset = queryset.only(*fields)
+
+            # Порог оператора % по умолчанию 0.3 — снижаем до NAME_SIMILARITY_THRESHOLD
+            # только на время этой транзакции. Полноту icontains это не возвращает:
+            # короткий фрагмент внутри слова ("ров" в "Петрова", похожесть ~0.09)
+            # ниже порога и не находится — это цена использования индекса
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+                        [str(NAME_SIMILARITY_THRESHOLD)]
+                    )
+                return list(queryset)
         except Exception as e:
-            print(f"❌ Ошибка при поиске клиентов: {e}")
+            logger.error("❌ Неожиданная ошибка при поиске клиентов: %s", e, exc_info=True)
             return []
 
-    @transaction.atomic
     def create_product(self, **kwargs) -> Optional[Product]:
-        """Создание нового товара"""
-        if not DJANGO_SETUP:
-            return None
+        """
+        Создание нового товара.
 
+        Некорректные поля (длина артикула, категория, цена) — ValidationError с текстом ошибки.
+        """
         try:
-            product = Product.objects.create(**kwargs)
-            print(f"✅ Товар создан: {product}")
+            product = Product(**kwargs)
+            # Длину проверяем до INSERT: иначе PostgreSQL ответит DataError
+            product.clean_fields()
+            product.save(force_insert=True)
+            logger.debug("✅ Товар создан: %s", product)
             return product
+        except ValidationError:
+            raise
         except IntegrityError as e:
-            print(f"❌ Ошибка при создании товара (дубликат артикула): {e}")
+            logger.warning("❌ Ошибка при создании товара (дубликат артикула): %s", e)
             return None
         except Exception as e:
-            print(f"❌ Неожиданная ошибка при создании товара: {e}")
+            logger.error("❌ Неожиданная ошибка при создании товара: %s", e, exc_info=True)
             return None
 
     def get_products_by_category(self, category: str) -> List[Product]:
         """Получение товаров по категории"""
-        if not DJANGO_SETUP:
-            return []
-
         try:
+            if _use_prepared_statements():
+                return _execute_prepared(Product, 'products_by_category', category)
             return list(Product.objects.filter(category=category, is_active=True))
         except Exception as e:
-            print(f"❌ Ошибка при получении товаров: {e}")
+            logger.error("❌ Неожиданная ошибка при получении товаров: %s", e, exc_info=True)
             return []
 
     def get_low_stock_products(self, threshold: int = 10) -> List[Product]:
         """Получение товаров с низким запасом"""
-        if not DJANGO_SETUP:
-            return []
-
         try:
+            if _use_prepared_statements():
+                return _execute_prepared(Product, 'low_stock_products', threshold)
             return list(Product.objects.filter(quantity__lt=threshold, is_active=True))
         except Exception as e:
-            print(f"❌ Ошибка при получении товаров: {e}")
+            logger.error("❌ Неожиданная ошибка при получении товаров: %s", e, exc_info=True)
             return []
 
     @transaction.atomic
     def create_order(self, customer_id: int, items: List[Dict[str, Any]],
                     notes: str = "") -> Optional[Order]:
-        """Создание заказа с элементами"""
-        if not DJANGO_SETUP:
-            return None
+        """
+        Создание заказа с элементами.
 
+        Некорректные поля заказа (длина примечаний) — ValidationError с текстом ошибки.
+        """
         try:
             customer = Customer.objects.get(id=customer_id)
-            order = Order.objects.create(customer=customer, notes=notes)
-
-            total_amount = 0
+            order = Order(customer=customer, notes=notes)
+            # Клиент уже загружен — повторно его существование не проверяем
+            order.clean_fields(exclude=['customer'])
+            order.save(force_insert=True)
+
+            # Повторяющиеся товары складываем: одна позиция и одна проверка остатка на товар
+            # (в заказе товар может быть только в одной позиции — unique_together)
+            wanted = defaultdict(int)
             for item in items:
-                product = Product.objects.get(id=item['product_id'])
+                wanted[item['product_id']] += item['quantity']
+
+            # Все товары заказа одним запросом, строки блокируются до конца транзакции;
+            # блокировки берутся по возрастанию pk — параллельные заказы не взаимоблокируются
+            products = Product.objects.select_for_update().order_by('pk').in_bulk(wanted.keys())
+
+            order_items = []
+            for product_id, quantity in wanted.items():
+                product = products.get(product_id)
+                if product is None:
+                    raise Product.DoesNotExist(f"Товар с ID {product_id} не найден")
 
                 # Проверяем наличие товара
-                if product.quantity < item['quantity']:
-                    raise ValueError(f"Недостаточно товара: {product.name}. На складе: {product.quantity}, требуется: {item['quantity']}")
+                if product.quantity < quantity:
+                    raise ValueError(f"Недостаточно товара: {product.name}. На складе: {product.quantity}, требуется: {quantity}")
 
-                # Создаем элемент заказа
-                order_item = OrderItem.objects.create(
+                # total_price вычисляет PostgreSQL (генерируемый столбец)
+                order_items.append(OrderItem(
                     order=order,
                     product=product,
-                    quantity=item['quantity'],
+                    quantity=quantity,
                     unit_price=product.price
-                )
+                ))
 
                 # Обновляем количество товара на складе
-                product.quantity -= item['quantity']
-                product.save()
+                product.quantity -= quantity
 
-                total_amount += float(order_item.total_price)
+            OrderItem.objects.bulk_create(order_items, batch_size=ORDER_ITEMS_BATCH_SIZE)
+            Product.objects.bulk_update(products.values(), ['quantity'], batch_size=500)
 
-            # Обновляем общую сумму заказа
-            order.total_amount = total_amount
-            order.save()
-
-            print(f"✅ Заказ создан: #{order.id}")
+            # Общая сумма считается в PostgreSQL и возвращается тем же UPDATE (RETURNING)
+            with connection.cursor() as cursor:
+                cursor.execute(f"""
+                    UPDATE {Order._meta.db_table}
+                    SET total_amount = COALESCE(
+                        (SELECT SUM(total_price) FROM {OrderItem._meta.db_table} WHERE order_id = %s), 0
+                    )
+                    WHERE id = %s
+                    RETURNING total_amount
+                """, [order.pk, order.pk])
+                order.total_amount = cursor.fetchone()[0]
+
+            logger.debug("✅ Заказ создан: #%s", order.id)
             return order
 
+        except ValidationError:
+            raise
         except (ObjectDoesNotExist, ValueError, IntegrityError) as e:
-            print(f"❌ Ошибка при создании заказа: {e}")
+            logger.warning("❌ Ошибка при создании заказа: %s", e)
             transaction.set_rollback(True)
             return None
         except Exception as e:
-            print(f"❌ Неожиданная ошибка при создании заказа: {e}")
+            logger.error("❌ Неожиданная ошибка при создании заказа: %s", e, exc_info=True)
             transaction.set_rollback(True)
             return None
 
     def get_orders_by_customer(self, customer_id: int) -> List[Order]:
         """Получение заказов клиента"""
-        if not DJANGO_SETUP:
-            return []
-
         try:
-            return list(Order.objects.filter(customer_id=customer_id).order_by('-order_date'))
+            return list(Order.objects.select_related('customer').filter(customer_id=customer_id).order_by('-order_date'))
         except Exception as e:
-            print(f"❌ Ошибка при получении заказов: {e}")
+            logger.error("❌ Неожиданная ошибка при получении заказов: %s", e, exc_info=True)
             return []
 
     def get_orders_by_status(self, status: str) -> List[Order]:
         """Получение заказов по статусу"""
-        if not DJANGO_SETUP:
-            return []
-
         try:
-            return list(Order.objects.filter(status=status).order_by('-order_date'))
+            return list(Order.objects.select_related('customer').filter(status=status).order_by('-order_date'))
         except Exception as e:
-            print(f"❌ Ошибка при получении заказов: {e}")
+            logger.error("❌ Неожиданная ошибка при получении заказов: %s", e, exc_info=True)
             return []
 
-    @transaction.atomic
     def update_order_status(self, order_id: int, new_status: str) -> bool:
         """Обновление статуса заказа"""
-        if not DJANGO_SETUP:
-            return False
-
         try:
-            order = Order.objects.get(id=order_id)
-            order.status = new_status
-            order.save()
-            print(f"✅ Статус заказа #{order_id} обновлен на '{new_status}'")
+            # Один UPDATE без предварительного SELECT; update() не трогает auto_now,
+            # поэтому updated_at выставляем явно
+            updated = Order.objects.filter(id=order_id).update(
+                status=new_status, updated_at=timezone.now()
+            )
+            if not updated:
+                logger.warning("❌ Заказ с ID %s не найден", order_id)
+                return False
+            logger.debug("✅ Статус заказа #%s обновлен на '%s'", order_id, new_status)
             return True
-        except ObjectDoesNotExist:
-            print(f"❌ Заказ с ID {order_id} не найден")
-            return False
         except Exception as e:
-            print(f"❌ Неожиданная ошибка при обновлении статуса: {e}")
+            logger.error("❌ Неожиданная ошибка при обновлении статуса: %s", e, exc_info=True)
             return False
 
-    def execute_custom_query(self, query: str, params: tuple = None) -> List[dict]:
-        """Выполнение произвольного SQL запроса"""
-        if not DJANGO_SETUP:
-            return []
+    def execute_custom_query(self, query: str, params: tuple = None,
+                             stream: bool = False) -> Union[List[dict], Iterator[dict]]:
+        """
+        Выполнение произвольного SQL запроса.
+
+        При stream=True возвращает генератор словарей: строки читаются
+        с сервера порциями, а не загружаются в память целиком.
+        """
+        if stream:
+            return self._stream_custom_query(query, params)
 
         try:
-            with connection.cursor() as cursor:
+            # Словари строит драйвер (на C) прямо при разборе результата,
+            # wrap_database_errors приводит ошибки драйвера к django.db.utils
+            connection.ensure_connection()
+            with connection.wrap_database_errors, _dict_cursor() as cursor:
                 cursor.execute(query, params or ())
-                if cursor.description:
-                    columns = [col[0] for col in cursor.description]
-                    rows = cursor.fetchall()
-                    return [dict(zip(columns, row)) for row in rows]
-                return []
+                return cursor.fetchall() if cursor.description else []
         except ProgrammingError as e:
-            print(f"❌ Ошибка SQL запроса: {e}")
+            logger.warning("❌ Ошибка SQL запроса: %s", e)
             return []
         except Exception as e:
-            print(f"❌ Неожиданная ошибка выполнения запроса: {e}")
+            logger.error("❌ Неожиданная ошибка выполнения запроса: %s", e, exc_info=True)
             return []
 
+    def _stream_custom_query(self, query: str, params: tuple = None) -> Iterator[dict]:
+        """Построчное чтение результата через серверный курсор"""
+        # Серверные курсоры несовместимы с PgBouncer в режиме transaction —
+        # в этом случае обычный курсор, но строки по-прежнему отдаются по одной
+        if connection.settings_dict.get('DISABLE_SERVER_SIDE_CURSORS'):
+            name = None
+        else:
+            name = f"custom_query_{threading.get_ident()}_{next(_cursor_counter)}"
+
+        try:
+            connection.ensure_connection()
+            cursor = _dict_cursor(name)
+            try:
+                with connection.wrap_database_errors:
+                    if name:
+                        cursor.itersize = STREAM_ITERSIZE
+                    cursor.execute(query, params or ())
+                    yield from cursor
+            finally:
+                # После неудачного DECLARE серверного курсора нет и CLOSE падает —
+                # эту ошибку глушим (как CursorWrapper в Django), иначе она
+                # подменит исходную ошибку запроса
+                try:
+                    cursor.close()
+                except connection.Database.Error:
+                    pass
+        except ProgrammingError as e:
+            logger.warning("❌ Ошибка SQL запроса: %s", e)
+        except Exception as e:
+            logger.error("❌ Неожиданная ошибка выполнения запроса: %s", e, exc_info=True)
+
     def get_database_stats(self) -> Dict[str, int]:
         """Получение статистики базы данных"""
-        if not DJANGO_SETUP:
-            return {}
+        # Все счетчики одним запросом вместо пяти отдельных COUNT(*)
+        query = f"""
+            SELECT
+                (SELECT COUNT(*) FROM {Customer._meta.db_table}),
+                (SELECT COUNT(*) FROM {Product._meta.db_table}),
+                (SELECT COUNT(*) FROM {Product._meta.db_table} WHERE is_active),
+                (SELECT COUNT(*) FROM {Order._meta.db_table}),
+                (SELECT COUNT(*) FROM {Order._meta.db_table} WHERE status = %s)
+        """
+        keys = ('customers', 'products', 'active_products', 'orders', 'pending_orders')
 
         try:
-            stats = {
-                'customers': Customer.objects.count(),
-                'products': Product.objects.count(),
-                'active_products': Product.objects.filter(is_active=True).count(),
-                'orders': Order.objects.count(),
-                'pending_orders': Order.objects.filter(status='pending').count(),
-            }
+            with connection.cursor() as cursor:
+                cursor.execute(query, ['pending'])
+                stats = dict(zip(keys, cursor.fetchone()))
             return stats
         except Exception as e:
-            print(f"❌ Ошибка при получении статистики: {e}")
+            logger.error("❌ Неожиданная ошибка при получении статистики: %s", e, exc_info=True)
             return {}
 
 
-    @transaction.atomic
     def create_student(self, **kwargs) -> Optional[Student]:
-        """Создание нового клиента"""
-        if not DJANGO_SETUP:
-            return None
-
+        """Создание нового студента"""
         try:
             student = Student.objects.create(**kwargs)
-            print(f"✅ Клиент создан: {student}")
+            logger.debug("✅ Студент создан: %s", student)
             return student
         except IntegrityError as e:
-            print(f"❌ Ошибка при создании клиента (дубликат email): {e}")
+            logger.warning("❌ Ошибка при создании студента (оценка вне 0–100 или пустое имя): %s", e)
             return None
         except Exception as e:
-            print(f"❌ Неожиданная ошибка при создании клиента: {e}")
+            logger.error("❌ Неожиданная ошибка при создании студента: %s", e, exc_info=True)
             return None
 
+
+def _has_pending_migrations() -> bool:
+    """Есть ли неприменённые миграции приложения database (одно чтение django_migrations)"""
+    from django.db.migrations.executor import MigrationExecutor
+
+    executor = MigrationExecutor(connection)
+    targets = executor.loader.graph.leaf_nodes('database')
+    return bool(executor.migration_plan(targets))
+
+
 def setup_database():
     """Настройка базы данных: создание и применение миграций."""
-    if not DJANGO_SETUP:
-        print("❌ Django не настроен")
-        return False
-
     from django.core.management import call_command
 
-    print("🔄 Инициализация таблиц в базе данных...")
+    logger.info("🔄 Инициализация таблиц в базе данных...")
 
     # 0. Убедиться, что пакет database.migrations существует (Django иначе не видит миграции)
     migrations_dir = Path(__file__).parent / 'migrations'
@@ -308,36 +496,29 @@ def setup_database():
 
     # 1. Создать миграции для приложения database (создаёт файлы в database/migrations/)
     try:
-        print("  Создание миграций...")
+        logger.info("Создание миграций...")
         call_command('makemigrations', 'database', verbosity=2)
-    except Exception as e:
-        print(f"⚠️ Ошибка создания миграций: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("⚠️ Ошибка создания миграций")
         return False
 
-    # 2. Применить миграции к БД
+    # 2. Применить миграции к БД (только если есть неприменённые)
     try:
+        if not _has_pending_migrations():
+            logger.info("✅ Все миграции уже применены")
+            return True
         call_command('migrate', 'database', verbosity=2)
-    except Exception as e:
-        print(f"❌ Ошибка применения миграций: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Ошибка применения миграций")
         return False
 
-    print("✅ Таблицы в базе данных созданы/обновлены")
+    logger.info("✅ Таблицы в базе данных созданы/обновлены")
     return True
 
 
 def create_test_data():
     """Создание тестовых данных"""
-    if not DJANGO_SETUP:
-        print("❌ Django не настроен")
-        return False
-
     try:
-        handler = PostgreSQLHandler()
-
         # Создаем тестовых клиентов
         test_customers = [
             {'first_name': 'Иван', 'last_name': 'Иванов', 'email': 'ivan@test.com', 'phone': '+79991234567'},
@@ -345,9 +526,6 @@ def create_test_data():
             {'first_name': 'Алексей', 'last_name': 'Сидоров', 'email': 'alex@test.com', 'phone': '+79999876543'},
         ]
 
-        for customer_data in test_customers:
-            handler.create_customer(**customer_data)
-
         # Создаем тестовые товары
         test_products = [
             {'name': 'Ноутбук HP', 'sku': 'NB001', 'category': 'electronics', 'price': 50000.00, 'quantity': 10, 'description': 'Мощный ноутбук'},
@@ -357,22 +535,31 @@ def create_test_data():
             {'name': 'Кофе', 'sku': 'FD001', 'category': 'food', 'price': 500.00, 'quantity': 100, 'description': 'Арабика молотый'},
         ]
 
-        for product_data in test_products:
-            handler.create_product(**product_data)
-
         test_students = [
-            {'first_name': 'Иван', 'student_grade': '50'},
-            {'first_name': 'Мария', 'student_grade': '60'},
-            {'first_name': 'Алексей', 'student_grade': '66'},
+            {'first_name': 'Иван', 'student_grade': 50},
+            {'first_name': 'Мария', 'student_grade': 60},
+            {'first_name': 'Алексей', 'student_grade': 66},
         ]
 
-        for student_data in test_students:
-            handler.create_student(**student_data)
-
-
-        print("✅ Тестовые данные созданы")
+        # Один INSERT на модель и один COMMIT на весь набор.
+        # ignore_conflicts — повторный запуск не падает на уже существующих email/артикулах
+        with transaction.atomic():
+            Customer.objects.bulk_create(
+                [Customer(**data) for data in test_customers],
+                batch_size=1000, ignore_conflicts=True
+            )
+            Product.objects.bulk_create(
+                [Product(**data) for data in test_products],
+                batch_size=1000, ignore_conflicts=True
+            )
+            Student.objects.bulk_create(
+                [Student(**data) for data in test_students],
+                batch_size=1000, ignore_conflicts=True
+            )
+
+        logger.info("✅ Тестовые данные созданы")
         return True
 
     except Exception as e:
-        print(f"❌ Ошибка создания тестовых данных: {e}")
+        logger.error("❌ Ошибка создания тестовых данных: %s", e, exc_info=True)
         return False
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:43
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0002_alter_student_options_and_more'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='customer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['first_name', 'last_name'], name='customers_name_trgm_idx', opclasses=['gin_trgm_ops', 'gin_trgm_ops']),
+        ),
+    ]
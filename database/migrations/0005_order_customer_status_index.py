@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0004_order_product_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='orders_status_762191_idx',
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['customer', 'status'], include=('order_date', 'total_amount'), name='orders_cust_status_cov'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0005_order_customer_status_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='product',
+            name='products_is_acti_cb485f_idx',
+        ),
+        # Фильтр category + is_active=True обслуживает частичный индекс ниже
+        migrations.RemoveIndex(
+            model_name='product',
+            name='products_categor_417272_idx',
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', 'sku'], name='product_active_catalog_idx'),
+        ),
+    ]
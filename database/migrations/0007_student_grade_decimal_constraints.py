@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:48
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0006_product_active_catalog_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='student',
+            name='student_grade',
+            field=models.DecimalField(decimal_places=2, max_digits=5, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)], verbose_name='Оценка студента'),
+        ),
+        migrations.AddConstraint(
+            model_name='student',
+            constraint=models.CheckConstraint(condition=models.Q(('student_grade__gte', 0), ('student_grade__lte', 100)), name='student_grade_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='student',
+            constraint=models.CheckConstraint(condition=models.Q(('first_name', ''), _negated=True), name='student_name_nonempty'),
+        ),
+    ]
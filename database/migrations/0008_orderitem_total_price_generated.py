@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:50
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0007_student_grade_decimal_constraints'),
+    ]
+
+    # Обычный столбец нельзя превратить в генерируемый через ALTER COLUMN,
+    # поэтому total_price пересоздается: значения вычислит PostgreSQL
+    operations = [
+        migrations.RemoveField(
+            model_name='orderitem',
+            name='total_price',
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='total_price',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('unit_price'), '*', models.F('quantity')), output_field=models.DecimalField(decimal_places=2, max_digits=12), verbose_name='Общая стоимость'),
+        ),
+    ]
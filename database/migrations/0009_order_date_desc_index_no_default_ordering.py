@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0008_orderitem_total_price_generated'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='order',
+            options={'verbose_name': 'Заказ', 'verbose_name_plural': 'Заказы'},
+        ),
+        migrations.RemoveIndex(
+            model_name='order',
+            name='orders_order_d_6e39a9_idx',
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['-order_date'], name='orders_order_date_desc_idx'),
+        ),
+    ]
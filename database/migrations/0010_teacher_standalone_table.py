@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0009_order_date_desc_index_no_default_ordering'),
+    ]
+
+    # Teacher больше не наследуется от Student: первичный ключ student_ptr
+    # нельзя превратить в собственный id, поэтому таблица пересоздается
+    operations = [
+        migrations.DeleteModel(
+            name='Teacher',
+        ),
+        migrations.CreateModel(
+            name='Teacher',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('first_name', models.CharField(max_length=100, verbose_name='Имя')),
+                ('qualification', models.CharField(max_length=100, verbose_name='Квалификация преподавателя')),
+                ('subject', models.CharField(max_length=100, verbose_name='Преподаваемый предмет')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата обновления')),
+            ],
+            options={
+                'verbose_name': 'Преподаватель',
+                'verbose_name_plural': 'Преподаватели',
+            },
+        ),
+    ]
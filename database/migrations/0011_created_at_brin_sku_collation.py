@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:52
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+from django.db.models.functions import Length
+
+SKU_MAX_LENGTH = 24
+
+
+def check_sku_length(apps, schema_editor):
+    """Артикулы длиннее SKU_MAX_LENGTH не влезут в varchar(24): перечисляем их до ALTER"""
+    Product = apps.get_model('database', 'Product')
+    too_long = list(
+        Product.objects.annotate(sku_length=Length('sku'))
+        .filter(sku_length__gt=SKU_MAX_LENGTH)
+        .values_list('sku', flat=True)
+    )
+    if too_long:
+        raise ValueError(
+            f"Артикулы длиннее {SKU_MAX_LENGTH} символов ({len(too_long)} шт.) — "
+            f"сократите их перед миграцией: {', '.join(too_long)}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0010_teacher_standalone_table'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_sku_length, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='product',
+            name='sku',
+            field=models.CharField(db_collation='C', max_length=24, unique=True, verbose_name='Артикул'),
+        ),
+        # Под сортировкой "C" уникальный индекс сам обслуживает LIKE 'префикс%',
+        # отдельный varchar_pattern_ops индекс (AlterField пересоздает его) не нужен
+        migrations.RunSQL(
+            sql='DROP INDEX IF EXISTS products_sku_81b9e9fe_like',
+            reverse_sql='CREATE INDEX products_sku_81b9e9fe_like ON products (sku varchar_pattern_ops)',
+        ),
+        # Дублировал уникальный индекс по sku
+        migrations.RemoveIndex(
+            model_name='product',
+            name='products_sku_fe2039_idx',
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='customers_created_brin'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='orders_created_brin'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='products_created_brin'),
+        ),
+    ]
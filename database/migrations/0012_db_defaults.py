@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:53
+
+import django.core.validators
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0011_created_at_brin_sku_collation'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='order_date',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), verbose_name='Дата заказа'),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='total_amount',
+            field=models.DecimalField(db_default=0, decimal_places=2, max_digits=12, verbose_name='Общая сумма'),
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='quantity',
+            field=models.IntegerField(db_default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name='Количество на складе'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0012_db_defaults'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customer',
+            name='address',
+            field=models.CharField(blank=True, max_length=500, verbose_name='Адрес'),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='notes',
+            field=models.CharField(blank=True, max_length=1000, verbose_name='Примечания'),
+        ),
+        # Длинные описания товаров сжимаются lz4 вместо pglz (PostgreSQL 14+):
+        # чтение вынесенных в TOAST значений распаковывается быстрее
+        migrations.RunSQL(
+            sql='ALTER TABLE products ALTER COLUMN description SET COMPRESSION lz4',
+            reverse_sql='ALTER TABLE products ALTER COLUMN description SET COMPRESSION DEFAULT',
+        ),
+    ]
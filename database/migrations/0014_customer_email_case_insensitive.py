@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:54
+
+from django.contrib.postgres.operations import CreateCollation
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0013_bounded_text_fields_description_lz4'),
+    ]
+
+    operations = [
+        # Недетерминированная ICU-сортировка второго уровня: регистр не учитывается
+        CreateCollation(
+            'case_insensitive',
+            provider='icu',
+            locale='und-u-ks-level2',
+            deterministic=False,
+        ),
+        migrations.RemoveIndex(
+            model_name='customer',
+            name='customers_email_92e882_idx',
+        ),
+        # Индекс varchar_pattern_ops из 0001 нельзя перестроить под недетерминированной
+        # сортировкой, а AlterField без смены типа его не удаляет
+        migrations.RunSQL(
+            sql='DROP INDEX IF EXISTS customers_email_af8f39bb_like',
+            reverse_sql='CREATE INDEX customers_email_af8f39bb_like ON customers (email varchar_pattern_ops)',
+        ),
+        migrations.AlterField(
+            model_name='customer',
+            name='email',
+            field=models.EmailField(db_collation='case_insensitive', max_length=254, unique=True, verbose_name='Электронная почта'),
+        ),
+    ]
@@ -1,9 +1,21 @@
 """
 Модель клиента.
 """
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
 from django.db import models
 
 
+class CustomerQuerySet(models.QuerySet):
+    """Выборки клиентов с заранее загруженными связями (без N+1 запросов)"""
+
+    def with_orders(self):
+        """Клиенты + их заказы, свежие первыми (один дополнительный запрос)"""
+        order = self.model._meta.get_field('orders').related_model
+        return self.prefetch_related(
+            models.Prefetch('orders', queryset=order.objects.order_by('-order_date'))
+        )
+
+
 class Customer(models.Model):
     """
     Модель клиента.
@@ -14,38 +26,36 @@ class Customer(models.Model):
     # Персональные данные
     first_name = models.CharField(max_length=100, verbose_name="Имя")
     last_name = models.CharField(max_length=100, verbose_name="Фамилия")
-    email = models.EmailField(unique=True, verbose_name="Электронная почта")
+    # Регистронезависимая ICU-сортировка (миграция 0014): Foo@X.com и foo@x.com —
+    # один и тот же адрес и для уникального индекса, и для filter(email=...)
+    email = models.EmailField(
+        unique=True,
+        db_collation='case_insensitive',
+        verbose_name="Электронная почта"
+    )
     phone = models.CharField(max_length=20, verbose_name="Телефон", blank=True)
-    address = models.TextField(verbose_name="Адрес", blank=True)
+    address = models.CharField(max_length=500, verbose_name="Адрес", blank=True)
     # Служебные поля (заполняются автоматически)
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
 
-    class Customer(models.Model):
-        """
-        Модель клиента.
-
-        Хранит персональные данные и контакты покупателя.
-        Связана с заказами через Order (один клиент — много заказов).
-        """
-        # Персональные данные
-        first_name = models.CharField(max_length=100, verbose_name="Имя")
-        last_name = models.CharField(max_length=100, verbose_name="Фамилия")
-        email = models.EmailField(unique=True, verbose_name="Электронная почта")
-        phone = models.CharField(max_length=20, verbose_name="Телефон", blank=True)
-        address = models.TextField(verbose_name="Адрес", blank=True)
-        # Служебные поля (заполняются автоматически)
-        created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
-        updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
+    objects = CustomerQuerySet.as_manager()
 
     class Meta:
         db_table = 'customers'
         verbose_name = 'Клиент'
         verbose_name_plural = 'Клиенты'
-        # Индексы для быстрого поиска по email и ФИО
+        # Индексы для быстрого поиска по ФИО (email покрыт уникальным индексом)
         indexes = [
-            models.Index(fields=['email']),
             models.Index(fields=['last_name', 'first_name']),
+            # Триграммный индекс для нечеткого поиска по имени (pg_trgm)
+            GinIndex(
+                name='customers_name_trgm_idx',
+                fields=['first_name', 'last_name'],
+                opclasses=['gin_trgm_ops', 'gin_trgm_ops'],
+            ),
+            # created_at растет монотонно: BRIN в разы меньше B-tree
+            BrinIndex(fields=['created_at'], name='customers_created_brin'),
         ]
 
     def __str__(self):
@@ -1,12 +1,24 @@
 """
 Модель заказа.
 """
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
-from django.utils import timezone
+from django.db.models.functions import Now
 
 from .Customer import Customer
 
 
+class OrderQuerySet(models.QuerySet):
+    """Выборки заказов с заранее загруженными связями (без N+1 запросов)"""
+
+    def with_details(self):
+        """Заказ + клиент (JOIN) + позиции с товарами (один дополнительный запрос)"""
+        order_item = self.model._meta.get_field('items').related_model
+        return self.select_related('customer').prefetch_related(
+            models.Prefetch('items', queryset=order_item.objects.select_related('product'))
+        )
+
+
 class Order(models.Model):
     """
     Модель заказа.
@@ -14,13 +26,15 @@ class Order(models.Model):
     Связывает клиента с набором позиций (OrderItem). Содержит общую сумму,
     статус и даты. PROTECT на клиенте — нельзя удалить клиента с заказами.
     """
-    STATUS_CHOICES = [
-        ('pending', 'В обработке'),
-        ('processing', 'В процессе'),
-        ('shipped', 'Отправлен'),
-        ('delivered', 'Доставлен'),
-        ('cancelled', 'Отменен'),
-    ]
+    class Status(models.TextChoices):
+        """Статусы заказа (внутренний код — отображаемое название)"""
+        PENDING = 'pending', 'В обработке'
+        PROCESSING = 'processing', 'В процессе'
+        SHIPPED = 'shipped', 'Отправлен'
+        DELIVERED = 'delivered', 'Доставлен'
+        CANCELLED = 'cancelled', 'Отменен'
+
+    STATUS_CHOICES = Status.choices
 
     customer = models.ForeignKey(
         Customer,
@@ -29,35 +43,54 @@ class Order(models.Model):
         verbose_name="Клиент"
     )
     order_date = models.DateTimeField(
-        default=timezone.now,
+        db_default=Now(),  # Время вставки по часам PostgreSQL
         verbose_name="Дата заказа"
     )
     status = models.CharField(
         max_length=20,
-        choices=STATUS_CHOICES,
-        default='pending',
+        choices=Status.choices,
+        default=Status.PENDING,
         verbose_name="Статус"
     )
     total_amount = models.DecimalField(
         max_digits=12,
         decimal_places=2,
         verbose_name="Общая сумма",
-        default=0
+        db_default=0  # Значение по умолчанию подставляет PostgreSQL
     )
-    notes = models.TextField(verbose_name="Примечания", blank=True)
+    notes = models.CharField(max_length=1000, verbose_name="Примечания", blank=True)
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
 
+    objects = OrderQuerySet.as_manager()
+
     class Meta:
         db_table = 'orders'
         verbose_name = 'Заказ'
         verbose_name_plural = 'Заказы'
         indexes = [
-            models.Index(fields=['status']),
-            models.Index(fields=['order_date']),
+            # Список заказов (свежие первыми): ORDER BY ... LIMIT читается прямо из индекса
+            models.Index(fields=['-order_date'], name='orders_order_date_desc_idx'),
             models.Index(fields=['customer', 'order_date']),
+            # Фильтр по статусу + сортировка по дате обслуживаются индексом без сортировки
+            models.Index(fields=['status', '-order_date']),
+            # Заказы клиента в определенном статусе: покрывающий индекс (index-only scan)
+            models.Index(
+                fields=['customer', 'status'],
+                include=['order_date', 'total_amount'],
+                name='orders_cust_status_cov',
+            ),
+            # created_at растет монотонно: BRIN в разы меньше B-tree
+            BrinIndex(fields=['created_at'], name='orders_created_brin'),
         ]
-        ordering = ['-order_date']  # Свежие заказы первыми
 
     def __str__(self):
         return f"Заказ #{self.id} - {self.customer}"
+
+    def get_status_display(self):
+        """Название статуса без построения словаря choices на каждый вызов"""
+        return _STATUS_DISPLAY.get(self.status, self.status)
+
+
+# Код статуса -> отображаемое название (строится один раз при импорте)
+_STATUS_DISPLAY = dict(Order.Status.choices)
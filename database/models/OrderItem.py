@@ -14,7 +14,7 @@ class OrderItem(models.Model):
 
     Связывает заказ и товар, хранит количество и цены. Один и тот же товар
     в одном заказе может быть только в одной позиции (unique_together).
-    total_price пересчитывается в save().
+    total_price — генерируемый столбец: его вычисляет PostgreSQL при записи строки.
     """
     order = models.ForeignKey(
         Order,
@@ -36,9 +36,10 @@ class OrderItem(models.Model):
         decimal_places=2,
         verbose_name="Цена за единицу"
     )
-    total_price = models.DecimalField(
-        max_digits=10,
-        decimal_places=2,
+    total_price = models.GeneratedField(
+        expression=models.F('unit_price') * models.F('quantity'),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        db_persist=True,
         verbose_name="Общая стоимость"
     )
 
@@ -48,10 +49,5 @@ class OrderItem(models.Model):
         verbose_name_plural = 'Элементы заказа'
         unique_together = ['order', 'product']  # Один товар — одна строка в заказе
 
-    def save(self, *args, **kwargs):
-        # Автоматически рассчитываем общую стоимость позиции
-        self.total_price = self.unit_price * self.quantity
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return f"{self.product.name} x{self.quantity}"
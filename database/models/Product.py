@@ -1,6 +1,7 @@
 """
 Модель товара (номенклатура).
 """
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
 from django.core.validators import MinValueValidator
 
@@ -12,21 +13,23 @@ class Product(models.Model):
     Описывает товар: название, категория, цена, остаток на складе.
     Артикул (sku) уникален. Неактивные товары (is_active=False) можно скрывать из каталога.
     """
-    # Допустимые значения категории (внутренний код — отображаемое название)
-    CATEGORY_CHOICES = [
-        ('electronics', 'Электроника'),
-        ('clothing', 'Одежда'),
-        ('books', 'Книги'),
-        ('food', 'Продукты'),
-        ('other', 'Другое'),
-    ]
+    class Category(models.TextChoices):
+        """Допустимые значения категории (внутренний код — отображаемое название)"""
+        ELECTRONICS = 'electronics', 'Электроника'
+        CLOTHING = 'clothing', 'Одежда'
+        BOOKS = 'books', 'Книги'
+        FOOD = 'food', 'Продукты'
+        OTHER = 'other', 'Другое'
+
+    CATEGORY_CHOICES = Category.choices
 
     name = models.CharField(max_length=200, verbose_name="Наименование")
+    # Описание может быть длинным: в БД сжимается lz4 (миграция 0013)
     description = models.TextField(verbose_name="Описание", blank=True)
     category = models.CharField(
         max_length=50,
-        choices=CATEGORY_CHOICES,
-        default='other',
+        choices=Category.choices,
+        default=Category.OTHER,
         verbose_name="Категория"
     )
     price = models.DecimalField(
@@ -38,9 +41,10 @@ class Product(models.Model):
     quantity = models.IntegerField(
         verbose_name="Количество на складе",
         validators=[MinValueValidator(0)],
-        default=0
+        db_default=0  # Значение по умолчанию подставляет PostgreSQL
     )
-    sku = models.CharField(max_length=50, unique=True, verbose_name="Артикул")
+    # Побайтовое сравнение (collation "C") удешевляет проверку уникальности при вставке
+    sku = models.CharField(max_length=24, unique=True, db_collation='C', verbose_name="Артикул")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
     is_active = models.BooleanField(default=True, verbose_name="Активен")
 
@@ -49,10 +53,25 @@ class Product(models.Model):
         verbose_name = 'Товар'
         verbose_name_plural = 'Товары'
         indexes = [
-            models.Index(fields=['category']),
-            models.Index(fields=['sku']),
-            models.Index(fields=['is_active']),
+            # Частичный индекс только по активным товарам (каталог)
+            models.Index(
+                fields=['category', 'sku'],
+                condition=models.Q(is_active=True),
+                name='product_active_catalog_idx',
+            ),
+            # Товары с низким запасом
+            models.Index(fields=['is_active', 'quantity']),
+            # created_at растет монотонно: BRIN в разы меньше B-tree
+            BrinIndex(fields=['created_at'], name='products_created_brin'),
         ]
 
     def __str__(self):
         return f"{self.name} ({self.sku})"
+
+    def get_category_display(self):
+        """Название категории без построения словаря choices на каждый вызов"""
+        return _CATEGORY_DISPLAY.get(self.category, self.category)
+
+
+# Код категории -> отображаемое название (строится один раз при импорте)
+_CATEGORY_DISPLAY = dict(Product.Category.choices)
@@ -1,21 +1,25 @@
 """
-Модель клиента.
+Модель студента.
 """
-from logging import raiseExceptions
-
+from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
 
 
 class Student(models.Model):
     """
-    Модель клиента.
+    Модель студента.
 
-    Хранит персональные данные и контакты покупателя.
-    Связана с заказами через Order (один клиент — много заказов).
+    Хранит имя и оценку студента (0–100); диапазон оценки и непустое имя
+    проверяются ограничениями в PostgreSQL.
     """
     # Персональные данные
     first_name = models.CharField(max_length=100, verbose_name="Имя")
-    student_grade = models.CharField(max_length=100, verbose_name="Оценка студента")
+    student_grade = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        verbose_name="Оценка студента",
+        validators=[MinValueValidator(0), MaxValueValidator(100)]
+    )
 
     # Служебные поля (заполняются автоматически)
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
@@ -23,25 +27,17 @@ class Student(models.Model):
 
     class Meta:
         ordering = ['first_name']  # добавьте этот атрибут
-
-    def __str__(self):
-        return self.first_name
-
-    def clean(self):
-        # Проверка, что имя не пустое
-        if not self.first_name:
-            raise ValueError("Имя студента не должно быть пустым.")
-        # Проверка, что оценка — число от 0 до 100
-        try:
-            grade_value = float(self.student_grade)
-        except ValueError:
-            raise ValueError("Оценка должна быть числом.")
-        if not (0 <= grade_value <= 100):
-            raise ValueError("Оценка должна быть в диапазоне от 0 до 100.")
-
-    def save(self, *args, **kwargs):
-        self.clean()  # вызываем clean перед сохранением
-        super().save(*args, **kwargs)
+        # Проверки выполняет PostgreSQL — они действуют и для bulk_create
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(student_grade__gte=0) & models.Q(student_grade__lte=100),
+                name='student_grade_range',
+            ),
+            models.CheckConstraint(
+                condition=~models.Q(first_name=''),
+                name='student_name_nonempty',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.first_name} ({self.id})"
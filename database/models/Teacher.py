@@ -1,12 +1,27 @@
+"""
+Модель преподавателя.
+"""
 from django.db import models
-from  .Student import Student
 
-class Teacher(Student):
+
+class Teacher(models.Model):
     """
-    Модель преподавателя, наследует от Student и добавляет дополнительные атрибуты.
+    Модель преподавателя.
+
+    Отдельная таблица без наследования от Student: выборка и сохранение
+    преподавателя не требуют JOIN и второго INSERT в таблицу студентов.
     """
+    first_name = models.CharField(max_length=100, verbose_name="Имя")
     qualification = models.CharField(max_length=100, verbose_name="Квалификация преподавателя")
     subject = models.CharField(max_length=100, verbose_name="Преподаваемый предмет")
 
+    # Служебные поля (заполняются автоматически)
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
+
+    class Meta:
+        verbose_name = 'Преподаватель'
+        verbose_name_plural = 'Преподаватели'
+
     def __str__(self):
-        return f"{self.first_name} ({self.teacher_id})"
\ No newline at end of file
+        return f"{self.first_name} ({self.pk})"
@@ -1,6 +1,7 @@
 """
 Главный файл приложения
 """
+import logging
 import sys
 import os
 from pathlib import Path
@@ -9,25 +10,24 @@ from pathlib import Path
 current_dir = Path(__file__).parent
 sys.path.append(str(current_dir))
 
+
+def setup_django():
+    """Инициализация Django: вызывается один раз, только на пути работы с БД"""
+    import django
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config')
+    django.setup()
+
+
 def main():
     """Точка входа в приложение"""
-    try:
-        # Проверяем наличие необходимых модулей
-        try:
-            import tkinter as tk
-            from tkinter import ttk
-        except ImportError:
-            print("❌ Tkinter не установлен. Установите его:")
-            print("Windows: Установлен по умолчанию с Python")
-            print("Linux: sudo apt-get install python3-tk")
-            print("macOS: brew install python-tk")
-            input("Нажмите Enter для выхода...")
-            return
+    # Выводим сообщения уровня INFO и выше; успешные операции БД пишутся в DEBUG
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
 
+    try:
         # Проверяем настройки Django
         try:
-            import django
-            from database.PostgreSQLHandler import PostgreSQLHandler
+            setup_django()
+            from database.PostgreSQLHandler import PostgreSQLHandler, setup_database, create_test_data
         except ImportError as e:
             print(f"❌ Ошибка импорта: {e}")
             print("Установите необходимые зависимости:")
@@ -41,7 +41,7 @@ def main():
 
         # Проверяем подключение к базе и инициализируем таблицы
         print("🔍 Проверка подключения к базе данных...")
-        handler = PostgreSQLHandler()
+        handler = PostgreSQLHandler.get_instance()
         if not handler.check_connection():
             print("\n⚠️  Не удалось подключиться к базе данных.")
             print("Хотите продолжить без подключения? (y/n)")
@@ -50,9 +50,19 @@ def main():
                 print("Выход из программы...")
                 return
 
-        from database.PostgreSQLHandler import setup_database
-        from database.PostgreSQLHandler import create_test_data
-        if setup_database():
+        # Tkinter нужен только для окна — проверяем его, когда до окна дошли
+        try:
+            import tkinter as tk
+        except ImportError:
+            print("❌ Tkinter не установлен. Установите его:")
+            print("Windows: Установлен по умолчанию с Python")
+            print("Linux: sudo apt-get install python3-tk")
+            print("macOS: brew install python-tk")
+            input("Нажмите Enter для выхода...")
+            return
+
+        # Тестовые данные — только по запросу (CREATE_TEST_DATA=True в .env)
+        if setup_database() and os.getenv('CREATE_TEST_DATA', 'False') == 'True':
             create_test_data()
 
         # Импортируем окно приложения
@@ -62,7 +72,7 @@ def main():
         root = tk.Tk()
 
         # Создаем и запускаем приложение
-        app = MainWindow(root)
+        app = MainWindow(root, handler)
 
         # Запускаем главный цикл
         root.mainloop()
@@ -1,24 +1,43 @@
 """
 Графический интерфейс приложения на Tkinter
 """
+import functools
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, simpledialog
 from datetime import datetime
 import threading
 
+from django.core.exceptions import ValidationError
+from django.db import close_old_connections, connection
+
 from database.PostgreSQLHandler import PostgreSQLHandler, setup_database, create_test_data
 
 
+def db_action(method):
+    """
+    Обработчик UI, обращающийся к БД.
+
+    Вне HTTP-запросов Django сам не вызывает close_old_connections(),
+    поэтому CONN_MAX_AGE и CONN_HEALTH_CHECKS применяются здесь: устаревшее
+    соединение закрывается, а оборванное проверяется и переоткрывается.
+    """
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        close_old_connections()
+        return method(*args, **kwargs)
+    return wrapper
+
+
 class MainWindow:
     """Главное окно приложения на Tkinter"""
 
-    def __init__(self, root):
+    def __init__(self, root, db_handler=None):
         self.root = root
         self.root.title("Desktop App with PostgreSQL (pg8000)")
         self.root.geometry("1200x700")
 
-        # Инициализируем обработчик БД
-        self.db_handler = PostgreSQLHandler()
+        # Обработчик БД: переданный из main.py или общий экземпляр
+        self.db_handler = db_handler or PostgreSQLHandler.get_instance()
 
         # Создание интерфейса
         self.create_widgets()
@@ -364,14 +383,14 @@ class MainWindow:
         try:
             # Загрузка клиентов
             from database.models import Customer
-            customers = Customer.objects.all()
+            customers = list(Customer.objects.all())
 
             # Обновляем в основном потоке
             self.root.after(0, self.update_customers_table, customers)
 
             # Загрузка товаров
             from database.models import Product
-            products = Product.objects.all()
+            products = list(Product.objects.all())
             self.root.after(0, self.update_products_table, products)
 
             # Обновление комбобокса клиентов
@@ -380,7 +399,7 @@ class MainWindow:
 
             # Загрузка заказов
             from database.models import Order
-            orders = Order.objects.select_related('customer').all()
+            orders = list(Order.objects.select_related('customer').order_by('-order_date'))
             self.root.after(0, self.update_orders_table, orders)
 
             # Статистика
@@ -389,6 +408,9 @@ class MainWindow:
 
         except Exception as e:
             self.root.after(0, self.show_error, "Ошибка загрузки данных", str(e))
+        finally:
+            # У каждого потока свое соединение: закрываем его вместе с потоком
+            connection.close()
 
     def check_thread_completion(self, thread):
         """Проверка завершения потока"""
@@ -468,6 +490,7 @@ class MainWindow:
         self.stats_text.delete(1.0, tk.END)
         self.stats_text.insert(1.0, stats_text)
 
+    @db_action
     def add_customer(self):
         """Добавление нового клиента"""
         try:
@@ -491,9 +514,12 @@ class MainWindow:
             else:
                 messagebox.showwarning("Ошибка", "Не удалось добавить клиента. Возможно, email уже существует.")
 
+        except ValidationError as e:
+            messagebox.showerror("Ошибка", "Некорректные данные:\n" + "\n".join(e.messages))
         except Exception as e:
             self.show_error("Ошибка при добавлении клиента", str(e))
 
+    @db_action
     def add_product(self):
         """Добавление нового товара"""
         try:
@@ -518,11 +544,14 @@ class MainWindow:
             else:
                 messagebox.showwarning("Ошибка", "Не удалось добавить товар. Возможно, артикул уже существует.")
 
+        except ValidationError as e:
+            messagebox.showerror("Ошибка", "Некорректные данные:\n" + "\n".join(e.messages))
         except ValueError as e:
             messagebox.showerror("Ошибка", f"Некорректные данные: {e}")
         except Exception as e:
             self.show_error("Ошибка при добавлении товара", str(e))
 
+    @db_action
     def create_order_dialog(self):
         """Диалог создания заказа"""
         try:
@@ -598,6 +627,7 @@ class MainWindow:
         except Exception as e:
             self.show_error("Ошибка при создании заказа", str(e))
 
+    @db_action
     def create_order_from_dialog(self, dialog, customer_selection):
         """Создание заказа из диалога"""
         try:
@@ -635,6 +665,8 @@ class MainWindow:
             else:
                 messagebox.showerror("Ошибка", "Не удалось создать заказ")
 
+        except ValidationError as e:
+            messagebox.showerror("Ошибка", "Некорректные данные:\n" + "\n".join(e.messages))
         except Exception as e:
             self.show_error("Ошибка при создании заказа", str(e))
 
@@ -645,6 +677,7 @@ class MainWindow:
             self.selected_order_item = item
             self.order_context_menu.post(event.x_root, event.y_root)
 
+    @db_action
     def change_order_status(self):
         """Изменение статуса заказа"""
         if not hasattr(self, 'selected_order_item'):
@@ -673,6 +706,7 @@ class MainWindow:
         except Exception as e:
             self.show_error("Ошибка при изменении статуса", str(e))
 
+    @db_action
     def show_order_details(self):
         """Показать детали заказа"""
         if not hasattr(self, 'selected_order_item'):
@@ -681,9 +715,9 @@ class MainWindow:
         try:
             order_id = self.orders_tree.item(self.selected_order_item)['values'][0]
 
-            from database.models import Order, OrderItem
-            order = Order.objects.get(id=order_id)
-            items = OrderItem.objects.filter(order=order).select_related('product')
+            from database.models import Order
+            order = Order.objects.with_details().get(id=order_id)
+            items = order.items.all()
 
             dialog = tk.Toplevel(self.root)
             dialog.title(f"Детали заказа #{order_id}")
@@ -704,13 +738,11 @@ class MainWindow:
 {'-' * 50}
 """
 
-            total = 0
             for item in items:
                 details += f"\n{item.product.name} x{item.quantity} = ₽{item.total_price}"
-                total += float(item.total_price)
 
             details += f"\n{'-' * 50}"
-            details += f"\nИтого: ₽{total}"
+            details += f"\nИтого: ₽{order.total_amount}"
 
             text.insert(1.0, details)
             text.config(state=tk.DISABLED)
@@ -718,6 +750,7 @@ class MainWindow:
         except Exception as e:
             self.show_error("Ошибка при получении деталей заказа", str(e))
 
+    @db_action
     def execute_custom_query(self):
         """Выполнение произвольного SQL запроса"""
         try:
@@ -752,6 +785,7 @@ class MainWindow:
         except Exception as e:
             self.show_error("Ошибка выполнения запроса", str(e))
 
+    @db_action
     def setup_database(self):
         """Настройка базы данных"""
         try:
@@ -763,6 +797,7 @@ class MainWindow:
         except Exception as e:
             self.show_error("Ошибка настройки базы данных", str(e))
 
+    @db_action
     def create_test_data(self):
         """Создание тестовых данных"""
         try:
@@ -774,6 +809,7 @@ class MainWindow:
         except Exception as e:
             self.show_error("Ошибка создания тестовых данных", str(e))
 
+    @db_action
     def test_connection(self):
         """Тест подключения к базе"""
         self.update_status_label()